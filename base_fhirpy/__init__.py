@@ -1,4 +1,6 @@
-from .lib import Client, SearchSet, Resource, Reference
+from .lib import (
+    Client, SearchSet, Resource, Reference,
+    AsyncClient, AsyncSearchSet, AsyncResource, AsyncReference)
 
 __title__ = 'base-fhir-py'
 __version__ = '0.0.1'
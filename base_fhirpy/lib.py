@@ -1,33 +1,81 @@
-import json
-import copy
+import asyncio
+import gzip
+import threading
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
+try:
+    import orjson
 
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    try:
+        import ujson as json
+    except ImportError:
+        import json
+
+    def _json_dumps(data):
+        return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+    _json_loads = json.loads
 
 from .utils import (
-    encode_params, convert_values, get_by_path, parse_path, chunks)
+    encode_params, convert_values, get_by_path, parse_path)
 from .exceptions import (
     ResourceNotFound, OperationOutcome, InvalidResponse)
 
 
+_BUILTIN_ROOTS = frozenset({'resourceType', 'id', 'meta', 'extension'})
+
+
+def _format_invalid_key_error(key, root_attrs):
+    return 'Invalid key `{0}`. Possible keys are `{1}`'.format(
+        key, ', '.join(root_attrs))
+
+
 class Client(ABC):
     schema = None
     resources_cache = None
     url = None
     authorization = None
     without_cache = False
+    session = None
+    pool_connections = 10
+    pool_maxsize = 50
+    max_workers = 4
+    _executor = None
+    _root_keys_cache = None
+    _root_keys_schema = None
+    response_cache_size = 256
+    # Request bodies larger than this size in bytes are sent gzipped.
+    # Disabled by default since not every server accepts compressed bodies
+    gzip_request_min_size = None
+    _response_cache = None
+    _response_cache_lock = None
 
     def __init__(self, url, authorization=None, with_cache=False,
                  schema=None):
         self.url = url
         self.authorization = authorization
-        self.resources_cache = defaultdict(dict)
+        # Resources are cached by (resource_type, id) key
+        self.resources_cache = {}
         self.without_cache = not with_cache
         if schema:
             self.schema = schema
 
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
+        self.session = self._create_session()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def __str__(self):  # pragma: no cover
         return '<{0} {1}>'.format(self.__class__.__name__, self.url)
 
@@ -48,28 +96,48 @@ class Client(ABC):
         if self.without_cache:
             return
 
-        self.resources_cache[resource.resource_type][resource.id] = resource
+        self.resources_cache[(resource.resource_type, resource.id)] = resource
 
     def _remove_resource_from_cache(self, resource):
         if self.without_cache:
             return
 
-        del self.resources_cache[resource.resource_type][resource.id]
+        del self.resources_cache[(resource.resource_type, resource.id)]
 
     def _get_resource_from_cache(self, resource_type, id):
         if self.without_cache:
             return None
 
-        return self.resources_cache[resource_type].get(id, None)
+        return self.resources_cache.get((resource_type, id), None)
 
     def clear_resources_cache(self, resource_type=None):
         if self.without_cache:
             return
 
         if resource_type:
-            self.resources_cache[resource_type] = {}
+            self.resources_cache = {
+                key: resource
+                for key, resource in self.resources_cache.items()
+                if key[0] != resource_type}
         else:
-            self.resources_cache = defaultdict(dict)
+            self.resources_cache = {}
+
+        self._invalidate_response_cache(resource_type)
+
+    def _invalidate_response_cache(self, resource_type=None):
+        if self.without_cache:
+            return
+
+        with self._response_cache_lock:
+            if not resource_type:
+                self._response_cache.clear()
+                return
+
+            prefix = '{0}/'.format(resource_type)
+            for key in list(self._response_cache):
+                path = key[0]
+                if path == resource_type or path.startswith(prefix):
+                    del self._response_cache[key]
 
     @abstractmethod
     def reference(self, resource_type=None, id=None, reference=None, **kwargs):
@@ -88,32 +156,142 @@ class Client(ABC):
     def resources(self, resource_type):
         return self.searchset_class(self, resource_type=resource_type)
 
+    def close(self):
+        """
+        Releases pooled connections held by the client session
+        and stops background workers
+        """
+        if self._executor:
+            self._executor.shutdown()
+            self._executor = None
+
+        self.session.close()
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        return self._executor
+
+    def _create_session(self):
+        # requests is imported here since it is heavy and isn't needed
+        # until a client is instantiated
+        from requests import Session
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.request import ACCEPT_ENCODING
+
+        session = Session()
+        # Includes `br` when brotli is installed and urllib3 can decode it
+        session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                              pool_maxsize=self.pool_maxsize)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return session
+
     def _do_request(self, method, path, data=None, params=None):
-        params = params or {}
-        params.update({'_format': 'json'})
-        url = '{0}/{1}?{2}'.format(
-            self.url, path, encode_params(params))
+        content = self._do_raw_request(method, path, data, params)
+
+        return _json_loads(content) if content else None
+
+    def _do_raw_request(self, method, path, data=None, params=None):
+        url, body, headers = self._prepare_request(path, data, params)
+        r = self.session.request(method, url, data=body, headers=headers)
+
+        return self._get_response_content(r.status_code, r.content)
+
+    def _prepare_request(self, path, data, params):
+        url = '{0}/{1}?_format=json'.format(self.url, path)
+        query_string = encode_params(params)
+        if query_string:
+            url = '{0}&{1}'.format(url, query_string)
+
+        headers = {}
+        if self.authorization:
+            headers['Authorization'] = self.authorization
+        body = None
+        if data is not None:
+            body = _json_dumps(data)
+            headers['Content-Type'] = 'application/json'
 
-        r = requests.request(
-            method,
-            url,
-            json=data,
-            headers={'Authorization': self.authorization})
+            if self.gzip_request_min_size is not None and \
+                    len(body) > self.gzip_request_min_size:
+                body = gzip.compress(body, compresslevel=1)
+                headers['Content-Encoding'] = 'gzip'
 
-        if 200 <= r.status_code < 300:
-            return json.loads(r.content) if r.content else None
+        return url, body, headers
 
-        if r.status_code == 404:
-            raise ResourceNotFound(r.content.decode())
+    def _get_response_content(self, status_code, content):
+        if 200 <= status_code < 300:
+            return content
 
-        raise OperationOutcome(r.content.decode())
+        if status_code == 404:
+            raise ResourceNotFound(content.decode())
 
-    def _fetch_resource(self, path, params=None):
-        return self._do_request('get', path, params=params)
+        raise OperationOutcome(content.decode())
+
+    def _fetch_resource(self, path, params=None, *, use_cache=False,
+                        refresh_cache=False):
+        """
+        Performs GET request. If `use_cache` is specified and caching is
+        enabled for the client, raw responses are kept in a bounded
+        LRU cache keyed by path and params.
+        If `refresh_cache` is specified, the cached response is ignored
+        and replaced with the fresh one
+        """
+        if not use_cache or self.without_cache:
+            return self._do_request('get', path, params=params)
+
+        key = self._get_response_cache_key(path, params)
+        content = None if refresh_cache \
+            else self._get_response_from_cache(key)
+        if content is None:
+            content = self._do_raw_request('get', path, params=params)
+            self._add_response_to_cache(key, content)
+
+        return _json_loads(content) if content else None
+
+    def _get_response_cache_key(self, path, params):
+        return (path, tuple(sorted(
+            (k, tuple(v) if isinstance(v, list) else v)
+            for k, v in (params or {}).items())))
+
+    def _get_response_from_cache(self, key):
+        with self._response_cache_lock:
+            content = self._response_cache.get(key)
+            if content is not None:
+                self._response_cache.move_to_end(key)
+
+            return content
+
+    def _add_response_to_cache(self, key, content):
+        with self._response_cache_lock:
+            self._response_cache[key] = content
+            while len(self._response_cache) > self.response_cache_size:
+                self._response_cache.popitem(last=False)
 
     def _get_schema(self):
         return self.schema
 
+    def _get_root_keys(self, resource_type):
+        schema = self._get_schema()
+        if not schema:
+            return frozenset()
+
+        if self._root_keys_cache is None or \
+                self._root_keys_schema is not schema:
+            self._root_keys_cache = {}
+            self._root_keys_schema = schema
+
+        root_keys = self._root_keys_cache.get(resource_type)
+        if root_keys is None:
+            root_keys = frozenset(schema.get(resource_type, ())) | \
+                        _BUILTIN_ROOTS
+            self._root_keys_cache[resource_type] = root_keys
+
+        return root_keys
+
 
 class SearchSet(ABC):
     client = None
@@ -135,8 +313,20 @@ class SearchSet(ABC):
         return resource
 
     def fetch(self, *, skip_caching=False):
+        resources, _ = self._fetch_page(skip_caching)
+
+        return resources
+
+    def _fetch_page(self, skip_caching):
         bundle_data = self.client._fetch_resource(
             self.resource_type, self.params)
+
+        return self._perform_bundle(bundle_data, skip_caching)
+
+    def _perform_bundle(self, bundle_data, skip_caching):
+        """
+        Returns tuple of (resources, is last page flag)
+        """
         bundle_resource_type = bundle_data.get('resourceType', None)
 
         if bundle_resource_type != 'Bundle':
@@ -144,35 +334,87 @@ class SearchSet(ABC):
                 'Expected to receive Bundle '
                 'but {0} received'.format(bundle_resource_type))
 
-        resources_data = [
-            res['resource'] for res in bundle_data.get('entry', [])]
+        # Lookups are hoisted out of the loop because bundles
+        # may contain thousands of entries
+        perform_resource = self._perform_resource
+        should_cache = not (skip_caching or self.client.without_cache)
+        resource_type = self.resource_type
 
         resources = []
-        for data in resources_data:
-            resource = self._perform_resource(data, skip_caching)
-            if resource.resource_type == self.resource_type:
+        for entry in bundle_data.get('entry', []):
+            data = entry['resource']
+            is_matched = data.get('resourceType', None) == resource_type
+            # Included resources are instantiated only to populate the cache
+            if not is_matched and not should_cache:
+                continue
+
+            resource = perform_resource(data, skip_caching)
+            if is_matched:
                 resources.append(resource)
 
-        return resources
+        return resources, self._is_last_page(bundle_data, resources)
 
-    def fetch_all(self, *, skip_caching=False):
-        page = 1
-        resources = []
+    def fetch_all(self, *, skip_caching=False, concurrency=4):
+        """
+        Fetches all pages. The first page is fetched alone, then
+        the next pages are requested in parallel keeping up to
+        `concurrency` requests in flight until the last page is received
+        """
+        self._validate_concurrency(concurrency)
 
-        while True:
-            new_resources = self.page(page).fetch(skip_caching=skip_caching)
-            if not new_resources:
-                break
+        resources, is_last_page = self.page(1)._fetch_page(skip_caching)
+        if is_last_page:
+            return resources
 
-            resources.extend(new_resources)
-            page += 1
+        executor = self.client._get_executor()
+        next_page = 2
+        pending = deque()
+
+        try:
+            while True:
+                while len(pending) < concurrency:
+                    pending.append(executor.submit(
+                        self.page(next_page)._fetch_page, skip_caching))
+                    next_page += 1
+
+                new_resources, is_last_page = pending.popleft().result()
+                resources.extend(new_resources)
+
+                if is_last_page:
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
 
         return resources
 
-    def get(self, id, *, skip_caching=False):
+    def _validate_concurrency(self, concurrency):
+        if concurrency < 1:
+            raise ValueError('`concurrency` must be a positive number')
+
+    def _is_last_page(self, bundle_data, resources):
+        # Page size can't be used to detect the last page since
+        # servers may cap `_count` and bundles may contain
+        # resources added by _include. The `next` link is used instead
+        # if the server provides links, otherwise only an empty page
+        # is considered as the last one
+        if not resources:
+            return True
+
+        links = bundle_data.get('link')
+        if links is None:
+            return False
+
+        return not any(link.get('relation') == 'next' for link in links)
+
+    def get(self, id, *, skip_caching=False, nocache=False):
         res_data = self.client._fetch_resource(
-            '{0}/{1}'.format(self.resource_type, id))
+            '{0}/{1}'.format(self.resource_type, id),
+            use_cache=not skip_caching, refresh_cache=nocache)
+
+        return self._perform_fetched_resource(res_data, skip_caching)
 
+    def _perform_fetched_resource(self, res_data, skip_caching):
         if res_data['resourceType'] != self.resource_type:
             raise InvalidResponse(
                 'Expected to receive {0} '
@@ -182,22 +424,30 @@ class SearchSet(ABC):
         return self._perform_resource(res_data, skip_caching)
 
     def count(self):
-        new_params = copy.deepcopy(self.params)
-        new_params['_count'] = 1
-        new_params['_totalMethod'] = 'count'
-
         return self.client._fetch_resource(
             self.resource_type,
-            params=new_params
+            params=self._get_count_params()
         )['total']
 
+    def _get_count_params(self):
+        new_params = self._copy_params()
+        new_params['_count'] = 1
+        new_params['_totalMethod'] = 'count'
+
+        return new_params
+
+    def _copy_params(self):
+        return defaultdict(list, {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in self.params.items()})
+
     def first(self):
         result = self.limit(1).fetch()
 
         return result[0] if result else None
 
     def clone(self, override=False, **kwargs):
-        new_params = copy.deepcopy(self.params)
+        new_params = self._copy_params()
         for key, value in kwargs.items():
             if not isinstance(value, list):
                 value = [value]
@@ -213,11 +463,10 @@ class SearchSet(ABC):
         attrs = set(attrs)
         if not exclude:
             attrs |= {'id', 'resourceType'}
-        attrs = [attr for attr in attrs]
+        elements = ','.join(attrs)
 
         return self.clone(
-            _elements='{0}{1}'.format('-' if exclude else '',
-                                      ','.join(attrs)),
+            _elements='-' + elements if exclude else elements,
             override=True
         )
 
@@ -243,11 +492,11 @@ class SearchSet(ABC):
                 '\'AuditEvent\', \'entity\', user=\'id\')`')
 
         key_part = ':'.join(
-            ['_has:{0}'.format(':'.join(pair))
-             for pair in chunks(args, 2)])
+            ['_has:{0}:{1}'.format(args[i], args[i + 1])
+             for i in range(0, len(args), 2)])
 
         return self.clone(
-            **{':'.join([key_part, key]): value
+            **{'{0}:{1}'.format(key_part, key): value
                for key, value in kwargs.items()})
 
     def revinclude(self, resource_type, attr, recursive=False):
@@ -292,18 +541,45 @@ class AbstractResource(dict):
         super(AbstractResource, self).__init__(**kwargs)
 
     def __eq__(self, other):
-        return isinstance(other, AbstractResource) \
-               and self.reference == other.reference
+        if not isinstance(other, AbstractResource):
+            return False
+
+        id = self.id
+        if id is None:
+            # Non-local references have no id but are still comparable
+            # by reference, unsaved resources are compared by identity
+            reference = self.reference
+            if reference is None:
+                return self is other
+
+            return reference == other.reference
+
+        return id == other.id and self.resource_type == other.resource_type
+
+    def __ne__(self, other):
+        # dict defines its own __ne__ comparing contents
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        id = self.id
+        if id is None:
+            reference = self.reference
+            if reference is None:
+                return object.__hash__(self)
+
+            return hash(reference)
+
+        return hash((self.resource_type, id))
 
     def __setitem__(self, key, value):
         self._raise_error_if_invalid_key(key)
 
-        super(AbstractResource, self).__setitem__(key, value)
+        dict.__setitem__(self, key, value)
 
     def __getitem__(self, key):
         self._raise_error_if_invalid_key(key)
 
-        return super(AbstractResource, self).__getitem__(key)
+        return dict.__getitem__(self, key)
 
     def get_by_path(self, path, default=None):
         keys = parse_path(path)
@@ -315,12 +591,12 @@ class AbstractResource(dict):
     def get(self, key, default=None):
         self._raise_error_if_invalid_key(key)
 
-        return super(AbstractResource, self).get(key, default)
+        return dict.get(self, key, default)
 
     def setdefault(self, key, default=None):
         self._raise_error_if_invalid_key(key)
 
-        return super(AbstractResource, self).setdefault(key, default)
+        return dict.setdefault(self, key, default)
 
     def serialize(self):
         def convert_fn(item):
@@ -331,8 +607,9 @@ class AbstractResource(dict):
             else:
                 return item, False
 
-        return convert_values(
-            {key: value for key, value in self.items()}, convert_fn)
+        # Resource itself must be converted as a plain dict, otherwise
+        # convert_fn would replace it with its own reference
+        return convert_values(dict(self), convert_fn)
 
     def get_root_keys(self):  # pragma: no cover
         raise NotImplementedError
@@ -357,15 +634,26 @@ class AbstractResource(dict):
         if not schema:
             return
         root_attrs = self.get_root_keys()
+        if not isinstance(root_attrs, (set, frozenset)):
+            root_attrs = frozenset(root_attrs)
+
+        if root_attrs.issuperset(keys):
+            return
 
         for key in keys:
             if key not in root_attrs:
-                raise KeyError(
-                    'Invalid key `{0}`. Possible keys are `{1}`'.format(
-                        key, ', '.join(root_attrs)))
+                raise KeyError(_format_invalid_key_error(key, root_attrs))
 
     def _raise_error_if_invalid_key(self, key):
-        self._raise_error_if_invalid_keys([key])
+        # Called on every item access, so it doesn't delegate
+        # to _raise_error_if_invalid_keys to keep the no-schema path cheap
+        schema = self.client._get_schema()
+        if not schema:
+            return
+        root_attrs = self.get_root_keys()
+
+        if key not in root_attrs:
+            raise KeyError(_format_invalid_key_error(key, root_attrs))
 
 
 class Resource(AbstractResource, ABC):
@@ -403,11 +691,7 @@ class Resource(AbstractResource, ABC):
         return self.__str__()
 
     def get_root_keys(self):
-        schema = self.client._get_schema()
-        if not schema:
-            return set()
-        return set(schema.get(self.resource_type, [])) | \
-               {'resourceType', 'id', 'meta', 'extension'}
+        return self.client._get_root_keys(self.resource_type)
 
     def save(self):
         data = self.client._do_request(
@@ -415,16 +699,26 @@ class Resource(AbstractResource, ABC):
             self._get_path(), 
             data=self.serialize())
 
+        self._perform_saved_data(data)
+
+    def _perform_saved_data(self, data):
         self['meta'] = data.get('meta', {})
         self['id'] = data.get('id')
 
         self.client._add_resource_to_cache(self)
+        self._invalidate_response_cache()
 
     def delete(self):
         self.client._remove_resource_from_cache(self)
+        self._invalidate_response_cache()
 
         return self.client._do_request('delete', self._get_path())
 
+    def _invalidate_response_cache(self):
+        # Bundles (e.g. transactions) may change resources of any type
+        self.client._invalidate_response_cache(
+            None if self.resource_type == 'Bundle' else self.resource_type)
+
     def to_resource(self, nocache=False):
         """
         Returns Resource instance for this resource
@@ -447,19 +741,22 @@ class Resource(AbstractResource, ABC):
 
     @property
     def id(self):
-        return self.get('id', None)
+        # `id` is always a valid root key, so validation is bypassed
+        return dict.get(self, 'id')
 
     @property
     def reference(self):
         """
         Returns reference if local resource is saved
         """
-        if self.id:
-            return '{0}/{1}'.format(self.resource_type, self.id)
+        id = dict.get(self, 'id')
+        if id:
+            return '{0}/{1}'.format(self.resource_type, id)
 
     def _get_path(self):
-        if self.id:
-            return '{0}/{1}'.format(self.resource_type, self.id)
+        id = dict.get(self, 'id')
+        if id:
+            return '{0}/{1}'.format(self.resource_type, id)
         elif self.resource_type == 'Bundle':
             return ''
 
@@ -488,7 +785,8 @@ class Reference(AbstractResource):
         if cached_resource and not nocache:
             return cached_resource
 
-        return self.client.resources(self.resource_type).get(self.id)
+        return self.client.resources(self.resource_type).get(
+            self.id, nocache=nocache)
 
     def to_reference(self, **kwargs):
         """
@@ -525,3 +823,169 @@ class Reference(AbstractResource):
     @abstractmethod
     def is_local(self):
         pass
+
+
+class AsyncClient(Client, ABC):
+    """
+    Client performing requests with httpx.AsyncClient.
+    Methods doing requests are coroutines
+    """
+    http2 = True
+
+    def __enter__(self):
+        raise TypeError('Use `async with` for {0}'.format(
+            self.__class__.__name__))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Releases pooled connections held by the client session
+        """
+        await self.session.aclose()
+
+    def _create_session(self):
+        # httpx is an optional dependency required for the async client only
+        import httpx
+
+        return httpx.AsyncClient(
+            http2=self.http2,
+            limits=httpx.Limits(max_connections=self.pool_maxsize))
+
+    async def _do_request(self, method, path, data=None, params=None):
+        content = await self._do_raw_request(method, path, data, params)
+
+        return _json_loads(content) if content else None
+
+    async def _do_raw_request(self, method, path, data=None, params=None):
+        url, body, headers = self._prepare_request(path, data, params)
+        r = await self.session.request(
+            method, url, content=body, headers=headers)
+
+        return self._get_response_content(r.status_code, r.content)
+
+    async def _fetch_resource(self, path, params=None, *, use_cache=False,
+                              refresh_cache=False):
+        if not use_cache or self.without_cache:
+            return await self._do_request('get', path, params=params)
+
+        key = self._get_response_cache_key(path, params)
+        content = None if refresh_cache \
+            else self._get_response_from_cache(key)
+        if content is None:
+            content = await self._do_raw_request('get', path, params=params)
+            self._add_response_to_cache(key, content)
+
+        return _json_loads(content) if content else None
+
+
+class AsyncSearchSet(SearchSet, ABC):
+    async def fetch(self, *, skip_caching=False):
+        resources, _ = await self._fetch_page(skip_caching)
+
+        return resources
+
+    async def _fetch_page(self, skip_caching):
+        bundle_data = await self.client._fetch_resource(
+            self.resource_type, self.params)
+
+        return self._perform_bundle(bundle_data, skip_caching)
+
+    async def fetch_all(self, *, skip_caching=False, concurrency=4):
+        """
+        Fetches all pages. The first page is fetched alone, then
+        the next pages are requested by batches of `concurrency` pages
+        until the last page is received
+        """
+        self._validate_concurrency(concurrency)
+
+        resources, is_last_page = await self.page(1)._fetch_page(
+            skip_caching)
+        if is_last_page:
+            return resources
+
+        next_page = 2
+
+        while True:
+            pages = await asyncio.gather(*[
+                self.page(page)._fetch_page(skip_caching)
+                for page in range(next_page, next_page + concurrency)])
+            next_page += concurrency
+
+            for new_resources, is_last_page in pages:
+                resources.extend(new_resources)
+
+                if is_last_page:
+                    return resources
+
+    async def get(self, id, *, skip_caching=False, nocache=False):
+        res_data = await self.client._fetch_resource(
+            '{0}/{1}'.format(self.resource_type, id),
+            use_cache=not skip_caching, refresh_cache=nocache)
+
+        return self._perform_fetched_resource(res_data, skip_caching)
+
+    async def count(self):
+        return (await self.client._fetch_resource(
+            self.resource_type,
+            params=self._get_count_params()
+        ))['total']
+
+    async def first(self):
+        result = await self.limit(1).fetch()
+
+        return result[0] if result else None
+
+    def __iter__(self):
+        raise TypeError('Use `async for` for {0}'.format(
+            self.__class__.__name__))
+
+    async def __aiter__(self):
+        for resource in await self.fetch():
+            yield resource
+
+
+class AsyncResource(Resource, ABC):
+    async def save(self):
+        data = await self.client._do_request(
+            'put' if self.id else 'post',
+            self._get_path(),
+            data=self.serialize())
+
+        self._perform_saved_data(data)
+
+    async def delete(self):
+        self.client._remove_resource_from_cache(self)
+        self._invalidate_response_cache()
+
+        return await self.client._do_request('delete', self._get_path())
+
+    async def to_resource(self, nocache=False):
+        """
+        Returns Resource instance for this resource
+        """
+        return self
+
+
+class AsyncReference(Reference, ABC):
+    async def to_resource(self, nocache=False):
+        """
+        Returns Resource instance for this reference from cache
+        if nocache is not specified and from fhir server otherwise.
+        """
+        if not self.is_local:
+            raise ResourceNotFound(
+                'Can not resolve not local resource')
+
+        cached_resource = self.client._get_resource_from_cache(
+            self.resource_type, self.id)
+
+        if cached_resource and not nocache:
+            return cached_resource
+
+        return await self.client.resources(self.resource_type).get(
+            self.id, nocache=nocache)
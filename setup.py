@@ -35,7 +35,12 @@ setup(
     author_email='fhirpy@beda.software',
     packages=['base_fhirpy'],
     include_package_data=True,
+    python_requires='>=3.6',
     install_requires=['requests'],
+    extras_require={
+        'orjson': ['orjson'],
+        'async': ['httpx[http2]'],
+    },
     zip_safe=False,
     classifiers=[
         'Development Status :: 4 - Beta',
@@ -44,8 +49,6 @@ setup(
         'Operating System :: OS Independent',
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Topic :: Internet :: WWW/HTTP',
         'Topic :: Software Development :: Libraries :: Python Modules',
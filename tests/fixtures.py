@@ -0,0 +1,159 @@
+import json
+
+from base_fhirpy import (
+    Client, SearchSet, Resource, Reference,
+    AsyncClient, AsyncSearchSet, AsyncResource, AsyncReference)
+
+
+def is_reference(value):
+    return isinstance(value, dict) and 'reference' in value \
+           and not (set(value.keys()) - {'reference', 'display'})
+
+
+class ReferenceMixin:
+    def get_root_keys(self):
+        return {'reference', 'display'}
+
+    @property
+    def reference(self):
+        return dict.get(self, 'reference')
+
+    @property
+    def id(self):
+        if self.is_local:
+            return self.reference.split('/')[1]
+
+    @property
+    def resource_type(self):
+        if self.is_local:
+            return self.reference.split('/')[0]
+
+    @property
+    def is_local(self):
+        return self.reference.count('/') == 1
+
+
+class ClientMixin:
+    def reference(self, resource_type=None, id=None, reference=None, **kwargs):
+        if reference is None:
+            reference = '{0}/{1}'.format(resource_type, id)
+
+        return self.reference_class(self, reference=reference, **kwargs)
+
+
+class SyncResource(Resource):
+    def is_reference(self, value):
+        return is_reference(value)
+
+
+class SyncReference(ReferenceMixin, Reference):
+    pass
+
+
+class SyncClient(ClientMixin, Client):
+    searchset_class = SearchSet
+    resource_class = SyncResource
+    reference_class = SyncReference
+
+
+class AsyncTestResource(AsyncResource):
+    def is_reference(self, value):
+        return is_reference(value)
+
+
+class AsyncTestReference(ReferenceMixin, AsyncReference):
+    pass
+
+
+class AsyncTestClient(ClientMixin, AsyncClient):
+    http2 = False
+    searchset_class = AsyncSearchSet
+    resource_class = AsyncTestResource
+    reference_class = AsyncTestReference
+
+
+class FakeServer:
+    """
+    In-memory FHIR server used instead of `Client._do_raw_request`.
+    Search results are paginated by `_count` and `page` params,
+    `_count` is capped by `max_count` if specified.
+    `includes` maps page number to the list of extra included entries.
+    Search bundles contain `self`/`next` links unless `with_links` is False
+    """
+
+    def __init__(self, resources=None, includes=None, max_count=None,
+                 with_links=True):
+        self.resources = {}
+        for resource in resources or []:
+            self.add(resource)
+        self.includes = includes or {}
+        self.max_count = max_count
+        self.with_links = with_links
+        self.requests = []
+
+    def add(self, resource):
+        path = '{0}/{1}'.format(resource['resourceType'], resource['id'])
+        self.resources[path] = resource
+
+    def handle(self, method, path, data=None, params=None):
+        params = params or {}
+        self.requests.append((method, path, params))
+
+        if method in ('put', 'post'):
+            if path in ('', 'Bundle'):
+                return json.dumps(data).encode()
+            resource = dict(data, id=data.get('id') or str(len(
+                self.resources) + 1))
+            self.add(resource)
+            return json.dumps(resource).encode()
+
+        if method == 'delete':
+            self.resources.pop(path, None)
+            return b''
+
+        if path in self.resources:
+            return json.dumps(self.resources[path]).encode()
+
+        return json.dumps(self.search(path, params)).encode()
+
+    def search(self, resource_type, params):
+        matched = [resource for path, resource in sorted(
+            self.resources.items(), key=lambda item: int(item[1]['id']))
+                   if resource['resourceType'] == resource_type]
+        count = int(self._get_param(params, '_count', 10))
+        if self.max_count:
+            count = min(count, self.max_count)
+        page = int(self._get_param(params, 'page', 1))
+        if '_totalMethod' in params:
+            return {'resourceType': 'Bundle', 'total': len(matched)}
+
+        entries = [{'resource': resource, 'search': {'mode': 'match'}}
+                   for resource in matched[(page - 1) * count:page * count]]
+        entries.extend(
+            {'resource': resource, 'search': {'mode': 'include'}}
+            for resource in self.includes.get(page, []))
+        bundle = {'resourceType': 'Bundle', 'entry': entries}
+
+        if self.with_links:
+            bundle['link'] = [{'relation': 'self', 'url': str(page)}]
+            if page * count < len(matched):
+                bundle['link'].append(
+                    {'relation': 'next', 'url': str(page + 1)})
+
+        return bundle
+
+    def _get_param(self, params, key, default):
+        value = params.get(key, default)
+        return value[-1] if isinstance(value, list) else value
+
+
+class AsyncFakeServer(FakeServer):
+    async def handle(self, method, path, data=None, params=None):
+        return super(AsyncFakeServer, self).handle(
+            method, path, data, params)
+
+
+def make_patients(count):
+    return [{'resourceType': 'Patient', 'id': str(index),
+             'name': [{'text': 'Patient {0}'.format(index)}]}
+            for index in range(1, count + 1)]
@@ -0,0 +1,154 @@
+import asyncio
+import unittest
+
+from .fixtures import AsyncTestClient, AsyncFakeServer, make_patients
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class AsyncClientTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = AsyncFakeServer(make_patients(25))
+        self.client = AsyncTestClient('http://fhir', with_cache=True)
+        self.client._do_raw_request = self.server.handle
+
+    def tearDown(self):
+        run(self.client.close())
+
+    def get_search_requests_count(self):
+        return len([request for request in self.server.requests
+                    if request[1] == 'Patient'])
+
+    def test_fetch(self):
+        resources = run(self.client.resources('Patient').limit(10).fetch())
+
+        self.assertEqual(len(resources), 10)
+
+    def test_fetch_all(self):
+        resources = run(
+            self.client.resources('Patient').limit(10).fetch_all())
+
+        self.assertEqual([resource.id for resource in resources],
+                         [str(index) for index in range(1, 26)])
+
+    def test_fetch_all_with_same_type_includes(self):
+        self.server.includes = {1: [
+            {'resourceType': 'Patient', 'id': 'linked-{0}'.format(i)}
+            for i in range(3)]}
+
+        resources = run(
+            self.client.resources('Patient').limit(10).fetch_all())
+
+        self.assertEqual(len(resources), 28)
+
+    def test_fetch_all_with_capped_count(self):
+        self.server.max_count = 5
+
+        resources = run(
+            self.client.resources('Patient').limit(10).fetch_all())
+
+        self.assertEqual([resource.id for resource in resources],
+                         [str(index) for index in range(1, 26)])
+
+    def test_fetch_all_without_links(self):
+        self.server.max_count = 5
+        self.server.with_links = False
+
+        resources = run(
+            self.client.resources('Patient').limit(10).fetch_all())
+
+        self.assertEqual(len(resources), 25)
+
+    def test_fetch_all_single_short_page(self):
+        resources = run(
+            self.client.resources('Patient').limit(30).fetch_all())
+
+        self.assertEqual(len(resources), 25)
+        self.assertEqual(self.get_search_requests_count(), 1)
+
+    def test_fetch_all_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            run(self.client.resources('Patient').fetch_all(concurrency=0))
+
+    def test_count_and_first(self):
+        patients = self.client.resources('Patient')
+
+        self.assertEqual(run(patients.count()), 25)
+        self.assertEqual(run(patients.first()).id, '1')
+
+    def test_async_iteration(self):
+        async def collect():
+            return [resource async for resource in
+                    self.client.resources('Patient').limit(5)]
+
+        self.assertEqual(len(run(collect())), 5)
+
+    def test_get_is_cached(self):
+        patients = self.client.resources('Patient')
+
+        run(patients.get('1'))
+        run(patients.get('1'))
+
+        self.assertEqual(len([request for request in self.server.requests
+                              if request[1] == 'Patient/1']), 1)
+
+    def test_save_and_delete(self):
+        patient = self.client.resource('Patient', name='new')
+
+        run(patient.save())
+        self.assertIsNotNone(patient.id)
+        self.assertIn(patient.reference, self.server.resources)
+
+        run(patient.delete())
+        self.assertNotIn(patient.reference, self.server.resources)
+
+    def test_resolve_references_concurrently(self):
+        patient = run(self.client.resources('Patient').get('1'))
+        items = [patient] + [self.client.reference('Patient', str(index))
+                             for index in range(2, 5)]
+
+        async def resolve():
+            return await asyncio.gather(
+                *[item.to_resource() for item in items])
+
+        self.assertEqual([resource.id for resource in run(resolve())],
+                         ['1', '2', '3', '4'])
+
+
+class AsyncClientRequestTestCase(unittest.TestCase):
+    def make_client(self, authorization=None):
+        import httpx
+
+        def handler(request):
+            self.headers = request.headers
+            return httpx.Response(
+                200, json={'resourceType': 'Patient', 'id': '1'})
+
+        client = AsyncTestClient('http://fhir', authorization=authorization)
+        client.session = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler))
+
+        return client
+
+    def test_request_without_authorization(self):
+        client = self.make_client()
+
+        patient = run(client.resources('Patient').get('1'))
+
+        self.assertEqual(patient.id, '1')
+        self.assertNotIn('authorization', self.headers)
+        run(client.close())
+
+    def test_request_with_authorization(self):
+        client = self.make_client('Bearer token')
+
+        run(client.resources('Patient').get('1'))
+
+        self.assertEqual(self.headers['authorization'], 'Bearer token')
+        run(client.close())
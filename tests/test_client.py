@@ -0,0 +1,101 @@
+import gzip
+import json
+import unittest
+from unittest import mock
+
+from base_fhirpy.lib import _json_dumps
+
+from .fixtures import SyncClient
+
+
+class ClientRequestTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = SyncClient('http://fhir', authorization='Bearer token')
+        self.request = mock.patch.object(
+            self.client.session, 'request',
+            return_value=mock.Mock(status_code=200, content=json.dumps(
+                {'resourceType': 'Bundle', 'entry': []}).encode())).start()
+
+    def tearDown(self):
+        mock.patch.stopall()
+        self.client.close()
+
+    def get_request_kwargs(self):
+        method, url = self.request.call_args[0]
+        return dict(self.request.call_args[1], method=method, url=url)
+
+    def test_fetch_does_not_change_search_params(self):
+        patients = self.client.resources('Patient').search(name='John')
+
+        patients.fetch()
+        patients.fetch()
+
+        self.assertEqual(dict(patients.params), {'name': ['John']})
+
+    def test_url_with_params(self):
+        self.client.resources('Patient').search(name='John').limit(10).fetch()
+
+        self.assertEqual(
+            self.get_request_kwargs()['url'],
+            'http://fhir/Patient?_format=json&name=John&_count=10')
+
+    def test_url_without_params(self):
+        self.client.resources('Patient').fetch()
+
+        self.assertEqual(self.get_request_kwargs()['url'],
+                         'http://fhir/Patient?_format=json')
+
+    def test_authorization_header(self):
+        self.client.resources('Patient').fetch()
+
+        self.assertEqual(
+            self.get_request_kwargs()['headers'],
+            {'Authorization': 'Bearer token'})
+
+
+class GzipRequestTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = SyncClient('http://fhir')
+        self.request = mock.patch.object(
+            self.client.session, 'request',
+            return_value=mock.Mock(status_code=200, content=json.dumps(
+                {'resourceType': 'Patient', 'id': '1'}).encode())).start()
+        self.patient = self.client.resource(
+            'Patient', id='1', name=[{'text': 'John ' * 10}])
+        self.body = _json_dumps(self.patient.serialize())
+
+    def tearDown(self):
+        mock.patch.stopall()
+        self.client.close()
+
+    def get_sent_request(self):
+        kwargs = self.request.call_args[1]
+        return kwargs['data'], kwargs['headers']
+
+    def test_body_above_threshold_is_gzipped(self):
+        self.client.gzip_request_min_size = len(self.body) - 1
+
+        self.patient.save()
+
+        data, headers = self.get_sent_request()
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(headers['Content-Type'], 'application/json')
+        self.assertEqual(gzip.decompress(data), self.body)
+
+    def test_body_at_threshold_is_not_gzipped(self):
+        self.client.gzip_request_min_size = len(self.body)
+
+        self.patient.save()
+
+        data, headers = self.get_sent_request()
+        self.assertNotIn('Content-Encoding', headers)
+        self.assertEqual(data, self.body)
+
+    def test_gzip_is_disabled_by_default(self):
+        self.assertIsNone(self.client.gzip_request_min_size)
+
+        self.patient.save()
+
+        data, headers = self.get_sent_request()
+        self.assertNotIn('Content-Encoding', headers)
+        self.assertEqual(data, self.body)
@@ -0,0 +1,100 @@
+import unittest
+
+from .fixtures import SyncClient, FakeServer, make_patients
+
+
+class FetchAllTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = SyncClient('http://fhir')
+
+    def tearDown(self):
+        self.client.close()
+
+    def use_server(self, server):
+        self.server = server
+        self.client._do_raw_request = server.handle
+
+    def get_search_requests_count(self):
+        return len([request for request in self.server.requests
+                    if request[1] == 'Patient'])
+
+    def test_fetch_all_pages_in_order(self):
+        self.use_server(FakeServer(make_patients(25)))
+
+        resources = self.client.resources('Patient').limit(10).fetch_all()
+
+        self.assertEqual([resource.id for resource in resources],
+                         [str(index) for index in range(1, 26)])
+
+    def test_fetch_all_sequentially(self):
+        self.use_server(FakeServer(make_patients(25)))
+
+        resources = self.client.resources('Patient').limit(10).fetch_all(
+            concurrency=1)
+
+        self.assertEqual(len(resources), 25)
+        self.assertEqual(self.get_search_requests_count(), 3)
+
+    def test_fetch_all_without_count(self):
+        self.use_server(FakeServer(make_patients(20)))
+
+        resources = self.client.resources('Patient').fetch_all()
+
+        self.assertEqual(len(resources), 20)
+
+    def test_fetch_all_with_same_type_includes(self):
+        includes = [{'resourceType': 'Patient', 'id': 'linked-{0}'.format(i)}
+                    for i in range(3)]
+        self.use_server(FakeServer(make_patients(25), includes={1: includes}))
+
+        resources = self.client.resources('Patient').limit(10).fetch_all()
+
+        self.assertEqual(len(resources), 28)
+        self.assertIn('25', [resource.id for resource in resources])
+
+    def test_fetch_all_with_capped_count(self):
+        self.use_server(FakeServer(make_patients(25), max_count=5))
+
+        resources = self.client.resources('Patient').limit(10).fetch_all()
+
+        self.assertEqual([resource.id for resource in resources],
+                         [str(index) for index in range(1, 26)])
+
+    def test_fetch_all_without_links(self):
+        self.use_server(FakeServer(
+            make_patients(25), max_count=5, with_links=False))
+
+        resources = self.client.resources('Patient').limit(10).fetch_all(
+            concurrency=1)
+
+        self.assertEqual(len(resources), 25)
+        # The last page can only be detected by an empty page
+        self.assertEqual(self.get_search_requests_count(), 6)
+
+    def test_fetch_all_single_short_page(self):
+        self.use_server(FakeServer(make_patients(5)))
+
+        resources = self.client.resources('Patient').limit(10).fetch_all()
+
+        self.assertEqual(len(resources), 5)
+        self.assertEqual(self.get_search_requests_count(), 1)
+
+    def test_fetch_all_empty(self):
+        self.use_server(FakeServer())
+
+        self.assertEqual(self.client.resources('Patient').fetch_all(), [])
+        self.assertEqual(self.get_search_requests_count(), 1)
+
+    def test_fetch_all_does_not_change_search_params(self):
+        self.use_server(FakeServer(make_patients(15)))
+        patients = self.client.resources('Patient').limit(10)
+
+        patients.fetch_all()
+
+        self.assertEqual(dict(patients.params), {'_count': [10]})
+
+    def test_fetch_all_invalid_concurrency(self):
+        self.use_server(FakeServer(make_patients(5)))
+
+        with self.assertRaises(ValueError):
+            self.client.resources('Patient').fetch_all(concurrency=0)
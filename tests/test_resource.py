@@ -0,0 +1,163 @@
+import unittest
+from unittest import mock
+
+from .fixtures import SyncClient, SyncReference
+
+
+class ResourceEqualityTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = SyncClient('http://fhir')
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_saved_resources_are_compared_by_type_and_id(self):
+        patient = self.client.resource('Patient', id='1', name='a')
+
+        self.assertEqual(
+            patient, self.client.resource('Patient', id='1', name='b'))
+        self.assertEqual(patient, self.client.reference('Patient', '1'))
+        self.assertNotEqual(patient, self.client.resource('Patient', id='2'))
+        self.assertNotEqual(
+            patient, self.client.resource('Organization', id='1'))
+
+    def test_saved_resources_are_deduplicated_in_sets(self):
+        resources = {
+            self.client.resource('Patient', id='1'),
+            self.client.resource('Patient', id='1'),
+            self.client.reference('Patient', '1'),
+            self.client.resource('Patient', id='2'),
+        }
+
+        self.assertEqual(len(resources), 2)
+
+    def test_unsaved_resources_are_compared_by_identity(self):
+        patient = self.client.resource('Patient', name='a')
+
+        self.assertEqual(patient, patient)
+        self.assertNotEqual(
+            patient, self.client.resource('Patient', name='a'))
+        self.assertEqual(len({
+            patient,
+            self.client.resource('Patient', name='b'),
+            self.client.resource('Organization'),
+        }), 3)
+
+    def test_non_local_references_are_compared_by_reference(self):
+        url = 'http://external/Patient/1'
+
+        self.assertEqual(self.client.reference(reference=url),
+                         self.client.reference(reference=url))
+        self.assertNotEqual(
+            self.client.reference(reference=url),
+            self.client.reference(reference='http://external/Patient/2'))
+        self.assertEqual(len({self.client.reference(reference=url),
+                              self.client.reference(reference=url)}), 1)
+
+
+class ListRootKeysReference(SyncReference):
+    def get_root_keys(self):
+        return ['reference', 'display']
+
+
+class SchemaValidationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = SyncClient(
+            'http://fhir', schema={'Patient': ['name', 'gender']})
+        self.patient = self.client.resource('Patient', id='1', name='John')
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_init(self):
+        self.client.resource('Patient', name='John', gender='male',
+                             meta={}, extension=[])
+
+        with self.assertRaises(KeyError):
+            self.client.resource('Patient', name='John', invalid=True)
+
+    def test_getitem(self):
+        self.assertEqual(self.patient['name'], 'John')
+
+        with self.assertRaises(KeyError):
+            self.patient['invalid']
+
+    def test_setitem(self):
+        self.patient['gender'] = 'male'
+        self.assertEqual(self.patient['gender'], 'male')
+
+        with self.assertRaises(KeyError):
+            self.patient['invalid'] = True
+        self.assertNotIn('invalid', self.patient)
+
+    def test_get(self):
+        self.assertEqual(self.patient.get('name'), 'John')
+        self.assertIsNone(self.patient.get('gender'))
+
+        with self.assertRaises(KeyError):
+            self.patient.get('invalid')
+
+    def test_setdefault(self):
+        self.assertEqual(self.patient.setdefault('gender', 'male'), 'male')
+
+        with self.assertRaises(KeyError):
+            self.patient.setdefault('invalid', True)
+
+    def test_error_message(self):
+        with self.assertRaises(KeyError) as context:
+            self.patient['invalid']
+
+        message = context.exception.args[0]
+        self.assertIn('Invalid key `invalid`', message)
+        for key in ['name', 'gender', 'resourceType', 'id', 'meta',
+                    'extension']:
+            self.assertIn(key, message)
+
+    def test_error_message_is_built_only_on_error(self):
+        with mock.patch('base_fhirpy.lib._format_invalid_key_error') \
+                as format_error:
+            self.client.resource('Patient', name='John', gender='male')
+            self.patient['name'] = 'Jack'
+            self.patient.get('gender')
+
+        format_error.assert_not_called()
+
+    def test_root_keys_are_memoized(self):
+        root_keys = self.client._get_root_keys('Patient')
+
+        self.assertIs(self.client._get_root_keys('Patient'), root_keys)
+        self.assertEqual(
+            root_keys,
+            {'name', 'gender', 'resourceType', 'id', 'meta', 'extension'})
+
+    def test_unknown_resource_type_has_builtin_keys_only(self):
+        self.client.resource('Organization', id='1', meta={})
+
+        with self.assertRaises(KeyError):
+            self.client.resource('Organization', name='Org')
+
+    def test_schema_reassignment_resets_root_keys(self):
+        self.client.resource('Patient', gender='male')
+
+        self.client.schema = {'Patient': ['birthDate']}
+
+        self.client.resource('Patient', birthDate='2000-01-01')
+        with self.assertRaises(KeyError):
+            self.client.resource('Patient', gender='male')
+
+    def test_non_set_root_keys(self):
+        self.client.reference_class = ListRootKeysReference
+
+        reference = self.client.reference('Patient', '1', display='John')
+        self.assertEqual(reference['display'], 'John')
+
+        with self.assertRaises(KeyError):
+            self.client.reference('Patient', '1', invalid=True)
+
+    def test_without_schema(self):
+        client = SyncClient('http://fhir')
+
+        patient = client.resource('Patient', invalid=True)
+
+        self.assertTrue(patient['invalid'])
+        client.close()
@@ -0,0 +1,119 @@
+import unittest
+
+from .fixtures import SyncClient, FakeServer, make_patients
+
+
+class ResponseCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeServer(make_patients(3))
+        self.client = SyncClient('http://fhir', with_cache=True)
+        self.client._do_raw_request = self.server.handle
+
+    def tearDown(self):
+        self.client.close()
+
+    def get_requests_count(self, path):
+        return len([request for request in self.server.requests
+                    if request[:2] == ('get', path)])
+
+    def test_get_is_cached(self):
+        patients = self.client.resources('Patient')
+
+        patients.get('1')
+        patients.get('1')
+
+        self.assertEqual(self.get_requests_count('Patient/1'), 1)
+
+    def test_cache_is_not_used_without_client_cache(self):
+        client = SyncClient('http://fhir')
+        client._do_raw_request = self.server.handle
+
+        client.resources('Patient').get('1')
+        client.resources('Patient').get('1')
+
+        self.assertEqual(self.get_requests_count('Patient/1'), 2)
+        client.close()
+
+    def test_skip_caching_bypasses_cache(self):
+        patients = self.client.resources('Patient')
+
+        patients.get('1', skip_caching=True)
+        patients.get('1', skip_caching=True)
+
+        self.assertEqual(self.get_requests_count('Patient/1'), 2)
+        self.assertEqual(len(self.client._response_cache), 0)
+
+    def test_nocache_refreshes_cached_response(self):
+        patients = self.client.resources('Patient')
+        patients.get('1')
+        self.server.resources['Patient/1']['name'] = 'new'
+
+        self.assertEqual(patients.get('1', nocache=True)['name'], 'new')
+        self.assertEqual(patients.get('1')['name'], 'new')
+        self.assertEqual(self.get_requests_count('Patient/1'), 2)
+
+    def test_reference_to_resource_nocache_refreshes_cached_response(self):
+        self.client.resources('Patient').get('1')
+        self.server.resources['Patient/1']['name'] = 'new'
+        reference = self.client.reference('Patient', '1')
+
+        self.assertEqual(reference.to_resource(nocache=True)['name'], 'new')
+        self.assertEqual(
+            self.client.resources('Patient').get('1')['name'], 'new')
+
+    def test_searches_are_not_cached(self):
+        patients = self.client.resources('Patient')
+
+        patients.fetch()
+        patients.fetch()
+        patients.count()
+
+        self.assertEqual(len(self.client._response_cache), 0)
+
+    def test_lru_eviction(self):
+        self.client.response_cache_size = 2
+        patients = self.client.resources('Patient')
+
+        patients.get('1')
+        patients.get('2')
+        patients.get('1')
+        patients.get('3')
+
+        self.assertEqual(
+            [key[0] for key in self.client._response_cache],
+            ['Patient/1', 'Patient/3'])
+
+    def test_save_invalidates_resource_type(self):
+        self.server.add({'resourceType': 'Organization', 'id': '10'})
+        patient = self.client.resources('Patient').get('1')
+        self.client.resources('Organization').get('10')
+
+        patient['name'] = 'changed'
+        patient.save()
+
+        self.assertEqual(
+            [key[0] for key in self.client._response_cache],
+            ['Organization/10'])
+
+    def test_delete_invalidates_resource_type(self):
+        patient = self.client.resources('Patient').get('1')
+
+        patient.delete()
+
+        self.assertEqual(len(self.client._response_cache), 0)
+
+    def test_bundle_save_clears_whole_cache(self):
+        self.client.resources('Patient').get('1')
+        bundle = self.client.resource(
+            'Bundle', type='transaction', entry=[])
+
+        bundle.save()
+
+        self.assertEqual(len(self.client._response_cache), 0)
+
+    def test_clear_resources_cache(self):
+        self.client.resources('Patient').get('1')
+
+        self.client.clear_resources_cache('Patient')
+
+        self.assertEqual(len(self.client._response_cache), 0)